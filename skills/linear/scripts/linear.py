@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 # /// script
 # dependencies = [
-#     "httpx",
+#     "brotli",
+#     "httpx[http2]",
+#     "orjson",
 #     "typer",
 # ]
 # ///
@@ -50,19 +52,31 @@ Commands:
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
 import mimetypes
 import os
-import subprocess
+import random
+import re
 import sys
+import time
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
 
-import httpx
 import typer
 
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # fall back to stdlib json
+
 
 # =============================================================================
 # Errors
@@ -86,6 +100,7 @@ class ErrorCode(str, Enum):
     INVALID_INPUT = "INVALID_INPUT"
     LABEL_NOT_FOUND = "LABEL_NOT_FOUND"
     FILE_NOT_FOUND = "FILE_NOT_FOUND"
+    FILE_TOO_LARGE = "FILE_TOO_LARGE"
     UPLOAD_FAILED = "UPLOAD_FAILED"
     MILESTONE_NOT_FOUND = "MILESTONE_NOT_FOUND"
     CYCLE_NOT_FOUND = "CYCLE_NOT_FOUND"
@@ -111,6 +126,7 @@ def format_success(
     command: str,
     result: dict[str, Any],
     metadata: dict[str, Any] | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """Format successful response."""
     response: dict[str, Any] = {
@@ -118,7 +134,7 @@ def format_success(
         "command": command,
         "result": result,
     }
-    if _verbose and metadata:
+    if verbose and metadata:
         response["metadata"] = metadata
     return response
 
@@ -139,16 +155,81 @@ def format_error(command: str, error: LinearError) -> dict[str, Any]:
     }
 
 
+def _compact_issue(issue: dict[str, Any]) -> dict[str, Any]:
+    """Build the compact issue summary returned by mutation commands."""
+    summary: dict[str, Any] = {
+        "identifier": issue.get("identifier"),
+        "title": issue.get("title"),
+        "url": issue.get("url"),
+        "state": (issue.get("state") or {}).get("name"),
+    }
+    label_nodes = (issue.get("labels") or {}).get("nodes") or []
+    if label_nodes:
+        summary["labels"] = [label["name"] for label in label_nodes]
+    return summary
+
+
 def output_json(data: dict[str, Any]) -> str:
     """Convert data to JSON string (always pretty-printed)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
     return json.dumps(data, indent=2, ensure_ascii=False)
 
 
+def write_json(data: dict[str, Any]) -> None:
+    """Write data to stdout as pretty-printed JSON with a trailing newline.
+
+    Writes orjson's bytes straight to the stdout buffer when possible, skipping
+    the bytes-to-str decode and re-encode that echoing output_json would pay.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        buffer.write(b"\n")
+        sys.stdout.flush()
+        return
+    json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+def parse_json_arg(text: str) -> Any:
+    """Parse a user-supplied JSON argument (orjson-accelerated when available).
+
+    Raises ValueError (the common base of both decoders' errors) on bad input.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 def has_next_page(connection: dict[str, Any]) -> bool:
     """Check if a Relay connection has more pages."""
     return connection.get("pageInfo", {}).get("hasNextPage", False)
 
 
+def _join_names(names: Iterable[str]) -> str:
+    """Join candidate names for an error suggestion (deduped, sorted)."""
+    return ", ".join(sorted(set(names)))
+
+
+def _run_resolutions(tasks: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """Run independent resolution callables, concurrently when there are several.
+
+    Each task is a network lookup against a different endpoint, so overlapping
+    them turns the wall time from the sum of the round-trips into the slowest
+    one. A LinearError raised by any task propagates unchanged.
+    """
+    if len(tasks) <= 1:
+        return {name: task() for name, task in tasks.items()}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = {name: pool.submit(task) for name, task in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -186,9 +267,10 @@ def get_api_key() -> str:
     return api_key
 
 
-def find_config_file() -> Path | None:
-    """Find .linear.json by searching upward from current directory."""
-    current = Path.cwd()
+@lru_cache(maxsize=8)
+def _find_config_file_from(start: Path) -> Path | None:
+    """Walk upward from start looking for .linear.json (one stat per ancestor)."""
+    current = start
 
     while current != current.parent:
         config_path = current / ".linear.json"
@@ -204,6 +286,15 @@ def find_config_file() -> Path | None:
     return None
 
 
+def find_config_file() -> Path | None:
+    """Find .linear.json by searching upward from current directory.
+
+    The walk stats every ancestor directory, so the result is memoized per cwd
+    — commands that resolve config more than once pay for the walk only once.
+    """
+    return _find_config_file_from(Path.cwd())
+
+
 # =============================================================================
 # Priority and State Parsing Helpers
 # =============================================================================
@@ -216,6 +307,9 @@ PRIORITY_NAMES = {
     "low": 4,
 }
 
+# Display names indexed by Linear's 0-4 priority integers
+PRIORITY_LABELS = ("None", "Urgent", "High", "Normal", "Low")
+
 STATE_TYPE_ALIASES = {
     "backlog": "backlog",
     "todo": "unstarted",
@@ -229,6 +323,7 @@ STATE_TYPE_ALIASES = {
 }
 
 
+@lru_cache(maxsize=32)
 def parse_priority(value: str) -> int:
     """Parse priority from number or name.
 
@@ -241,9 +336,13 @@ def parse_priority(value: str) -> int:
     Raises:
         LinearError: If value is invalid
     """
-    # Try as number first
-    if value.isdigit():
+    # Try as number first — a single int() conversion instead of isdigit()+int()
+    try:
         num = int(value)
+    except ValueError:
+        num = None
+
+    if num is not None:
         if 0 <= num <= 4:
             return num
         raise LinearError(
@@ -265,6 +364,24 @@ def parse_priority(value: str) -> int:
     )
 
 
+@lru_cache(maxsize=4)
+def _read_config_file(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse .linear.json, memoized per (path, mtime) so repeat loads are free.
+
+    The mtime in the cache key keeps the cache honest if the file is edited
+    while a process is alive.
+    """
+    try:
+        with open(path_str) as f:
+            return json.load(f)
+    except json.JSONDecodeError as e:
+        raise LinearError(
+            code=ErrorCode.INVALID_CONFIG,
+            message=f"Invalid JSON in .linear.json: {e}",
+            suggestions=["Check .linear.json for syntax errors"],
+        )
+
+
 def load_config(config_path: Path | None = None) -> LinearConfig:
     """Load configuration from .linear.json.
 
@@ -285,15 +402,7 @@ def load_config(config_path: Path | None = None) -> LinearConfig:
             ],
         )
 
-    try:
-        with open(config_path) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise LinearError(
-            code=ErrorCode.INVALID_CONFIG,
-            message=f"Invalid JSON in .linear.json: {e}",
-            suggestions=["Check .linear.json for syntax errors"],
-        )
+    data = _read_config_file(str(config_path), config_path.stat().st_mtime_ns)
 
     if "teamId" not in data:
         raise LinearError(
@@ -327,15 +436,7 @@ def _load_config_optional(config_path: Path | None = None) -> LinearConfig | Non
     if config_path is None or not config_path.exists():
         return None
 
-    try:
-        with open(config_path) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise LinearError(
-            code=ErrorCode.INVALID_CONFIG,
-            message=f"Invalid JSON in .linear.json: {e}",
-            suggestions=["Check .linear.json for syntax errors"],
-        )
+    data = _read_config_file(str(config_path), config_path.stat().st_mtime_ns)
 
     if not isinstance(data, dict):
         raise LinearError(
@@ -389,7 +490,7 @@ def resolve_config(
         if len(teams) == 1:
             team_id = teams[0]["id"]
         else:
-            keys = ", ".join(sorted(t.get("key", "") for t in teams if t.get("key")))
+            keys = _join_names(t.get("key", "") for t in teams if t.get("key"))
             suggestions = []
             if keys:
                 suggestions.append(f"Available team keys: {keys}")
@@ -420,9 +521,11 @@ def resolve_config(
 # GraphQL Queries & Mutations
 # =============================================================================
 
-QUERY_ISSUE = """
-query Issue($id: String!) {
-  issue(id: $id) {
+# The issue queries share almost their entire selection set, so the shared
+# field blocks live in fragments and the query variants are composed once at
+# import time.
+
+FRAG_ISSUE_CORE = """\
     id
     identifier
     title
@@ -480,6 +583,9 @@ query Issue($id: String!) {
       key
       name
     }
+"""
+
+FRAG_ISSUE_RELATIONS = """\
     relations {
       pageInfo { hasNextPage }
       nodes {
@@ -509,6 +615,9 @@ query Issue($id: String!) {
         title
       }
     }
+"""
+
+FRAG_ISSUE_DOCUMENTS = """\
     documents {
       pageInfo { hasNextPage }
       nodes {
@@ -518,114 +627,18 @@ query Issue($id: String!) {
         slugId
       }
     }
+"""
+
+FRAG_COMMENT_COUNT = """\
     comments {
       pageInfo { hasNextPage }
       nodes {
         id
       }
     }
-  }
-}
 """
 
-QUERY_ISSUE_WITH_COMMENTS = """
-query Issue($id: String!) {
-  issue(id: $id) {
-    id
-    identifier
-    title
-    description
-    priority
-    estimate
-    url
-    state {
-      id
-      name
-      type
-    }
-    assignee {
-      id
-      name
-      email
-    }
-    parent {
-      identifier
-      title
-    }
-    children {
-      pageInfo { hasNextPage }
-      nodes {
-        identifier
-        title
-        priority
-        estimate
-        state {
-          name
-        }
-      }
-    }
-    project {
-      id
-      name
-    }
-    projectMilestone {
-      id
-      name
-    }
-    cycle {
-      id
-      number
-      name
-    }
-    labels {
-      nodes {
-        id
-        name
-      }
-    }
-    team {
-      id
-      key
-      name
-    }
-    relations {
-      pageInfo { hasNextPage }
-      nodes {
-        id
-        type
-        relatedIssue {
-          identifier
-          title
-        }
-      }
-    }
-    inverseRelations {
-      pageInfo { hasNextPage }
-      nodes {
-        id
-        type
-        issue {
-          identifier
-          title
-        }
-      }
-    }
-    attachments {
-      pageInfo { hasNextPage }
-      nodes {
-        url
-        title
-      }
-    }
-    documents {
-      pageInfo { hasNextPage }
-      nodes {
-        id
-        title
-        url
-        slugId
-      }
-    }
+FRAG_COMMENTS_FULL = """\
     comments(first: 50) {
       pageInfo { hasNextPage }
       nodes {
@@ -637,10 +650,26 @@ query Issue($id: String!) {
         }
       }
     }
-  }
-}
 """
 
+
+def _compose_issue_query(*fragments: str) -> str:
+    """Assemble an issue(id) query from field fragments."""
+    return (
+        "\nquery Issue($id: String!) {\n  issue(id: $id) {\n"
+        + "".join(fragments)
+        + "  }\n}\n"
+    )
+
+
+QUERY_ISSUE = _compose_issue_query(
+    FRAG_ISSUE_CORE, FRAG_ISSUE_RELATIONS, FRAG_ISSUE_DOCUMENTS, FRAG_COMMENT_COUNT
+)
+
+QUERY_ISSUE_WITH_COMMENTS = _compose_issue_query(
+    FRAG_ISSUE_CORE, FRAG_ISSUE_RELATIONS, FRAG_ISSUE_DOCUMENTS, FRAG_COMMENTS_FULL
+)
+
 QUERY_WORKFLOW_STATES = """
 query {
   workflowStates {
@@ -740,23 +769,38 @@ query {
 }
 """
 
+# Slim lookup for identifier → UUID resolution.
+QUERY_ISSUE_ID = """
+query IssueId($id: String!) {
+  issue(id: $id) {
+    id
+  }
+}
+"""
+
+# Slim lookup for state changes: only the team id is needed, so skip the
+# full issue field set.
+QUERY_ISSUE_TEAM = """
+query IssueTeam($id: String!) {
+  issue(id: $id) {
+    id
+    team { id }
+  }
+}
+"""
+
 QUERY_ISSUES = """
 query Issues($filter: IssueFilter, $first: Int) {
   issues(filter: $filter, first: $first) {
     nodes {
-      id
       identifier
       title
       priority
       estimate
-      state { id name type }
-      assignee { id name email }
-      creator { id name email }
-      project { id name }
-      projectMilestone { id name }
-      cycle { id number name }
-      labels { nodes { id name } }
-      team { id key name }
+      state { name }
+      assignee { name }
+      cycle { number name }
+      labels { nodes { name } }
     }
   }
 }
@@ -794,6 +838,23 @@ mutation IssueCreate($input: IssueCreateInput!) {
 }
 """
 
+MUTATION_BATCH_CREATE_ISSUES = """
+mutation IssueBatchCreate($input: IssueBatchCreateInput!) {
+  issueBatchCreate(input: $input) {
+    success
+    issues {
+      id
+      identifier
+      title
+      url
+      state {
+        name
+      }
+    }
+  }
+}
+"""
+
 MUTATION_UPDATE_ISSUE = """
 mutation IssueUpdate($id: String!, $input: IssueUpdateInput!) {
   issueUpdate(id: $id, input: $input) {
@@ -1020,8 +1081,6 @@ query {
       name
       color
       description
-      isGroup
-      parent { id name }
       team { id key name }
     }
   }
@@ -1041,8 +1100,6 @@ query TeamLabels($teamId: String!) {
         name
         color
         description
-        isGroup
-        parent { id name }
       }
     }
   }
@@ -1306,18 +1363,214 @@ mutation CustomViewDelete($id: String!) {
 """
 
 
+# Request bodies for the queries that take no variables, encoded once at import
+# so _request can skip the per-call JSON encode for them.
+_STATIC_QUERY_BODIES: dict[str, bytes] = {
+    query: json.dumps({"query": query}).encode()
+    for query in (
+        QUERY_WORKFLOW_STATES,
+        QUERY_PROJECTS,
+        QUERY_TEAMS,
+        QUERY_VIEWER,
+        QUERY_USERS,
+        QUERY_LABELS,
+        QUERY_CUSTOM_VIEWS,
+    )
+}
+
+
 # =============================================================================
 # Linear API Client
 # =============================================================================
 
+# Uploaded assets are immutable, so tell the CDN to cache them for a year.
+_UPLOAD_CACHE_CONTROL = "public, max-age=31536000"
+
+# Document content travels inline in the GraphQL mutation body, so cap what
+# `document --file` will slurp before reading it into memory.
+MAX_DOCUMENT_BYTES = 10 * 1024 * 1024
+
+
+@lru_cache(maxsize=64)
+def _guess_content_type(suffix: str) -> str:
+    """Content type for a (lowercased) file suffix, cached across uploads."""
+    content_type, _ = mimetypes.guess_type(f"file{suffix}")
+    return content_type or "application/octet-stream"
+
+
+# UUID-shaped identifiers (as opposed to "ABC-123" style) can be passed to the
+# API directly without a get_issue resolution round-trip.
+_UUID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+# Git remote URL in HTTPS (https://host/org/repo.git) or SCP-style SSH
+# (user@host:org/repo.git) form, capturing host and path in one pass.
+_REMOTE_URL_RE = re.compile(
+    r"^(?:https?://(?P<http_host>[^/]+)/(?P<http_path>.+?)"
+    r"|[\w.-]+@(?P<ssh_host>[^:/]+):(?P<ssh_path>.+?))"
+    r"(?:\.git)?/?$"
+)
+
+# Common state-name aliases mapped to Linear workflow state types, used as a
+# fallback when no state matches by name (e.g. "done" → the completed state).
+_STATE_TYPE_MAPPING = {
+    "done": "completed",
+    "complete": "completed",
+    "finished": "completed",
+    "todo": "unstarted",
+    "backlog": "backlog",
+    "in progress": "started",
+    "started": "started",
+    "cancelled": "canceled",
+    "canceled": "canceled",
+}
+
+# Opt-in on-disk cache for slow-changing reference data (labels, states,
+# projects, users), so repeated CLI invocations skip the network entirely.
+# Off by default: a stale entry can silently misresolve a name, so callers
+# must opt in with LINEAR_DISK_CACHE=1.
+DISK_CACHE_ENV = "LINEAR_DISK_CACHE"
+DISK_CACHE_TTL = 300.0
+DISK_CACHE_PATH = Path.home() / ".cache" / "llm-toolkit" / "linear-cache.json"
+
+
+def _disk_cache_enabled() -> bool:
+    return os.environ.get(DISK_CACHE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def _disk_cache_load() -> dict[str, Any]:
+    try:
+        raw = DISK_CACHE_PATH.read_bytes()
+        store = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return {}
+    return store if isinstance(store, dict) else {}
+
+
+def _disk_cache_read(key: str) -> Any:
+    entry = _disk_cache_load().get(key)
+    if not isinstance(entry, dict):
+        return None
+    if time.time() - entry.get("at", 0) >= DISK_CACHE_TTL:
+        return None
+    return entry.get("data")
+
+
+def _disk_cache_update(changes: dict[str, Any], remove_prefix: str | None = None) -> None:
+    """Merge changes into the cache file atomically; failures are ignored."""
+    try:
+        store = _disk_cache_load()
+        if remove_prefix is not None:
+            store = {k: v for k, v in store.items() if not k.startswith(remove_prefix)}
+        store.update(changes)
+        DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        payload = (
+            orjson.dumps(store)
+            if orjson is not None
+            else json.dumps(store).encode("utf-8")
+        )
+        tmp = DISK_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, DISK_CACHE_PATH)
+    except OSError:
+        pass
+
+
+# Process-wide HTTP client: one connection pool shared by every LinearClient,
+# so repeated GraphQL calls in an invocation reuse the same TCP/TLS connection.
+# httpx itself is imported here rather than at module top: it drags in ssl and
+# friends, which dominate cold start for invocations that never hit the network
+# (--version, --help, bad arguments).
+_http_client: httpx.Client | None = None
+
+
+def get_http_client() -> httpx.Client:
+    """Return the shared httpx.Client, creating it lazily on first use."""
+    global _http_client, httpx
+    if _http_client is None:
+        import httpx
+
+        _http_client = httpx.Client(
+            http2=True,
+            timeout=30.0,
+            # H2 multiplexes streams over one connection, so the pool stays small.
+            limits=httpx.Limits(
+                max_connections=10, max_keepalive_connections=4, keepalive_expiry=60.0
+            ),
+        )
+        atexit.register(close_http_client)
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared httpx.Client; a later request recreates it."""
+    global _http_client
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+
 
 class LinearClient:
     """Client for Linear GraphQL API."""
 
+    # Reference data (labels, states, projects, users) changes rarely; list
+    # fetches are cached per (kind, team) for this long so resolution loops
+    # don't re-issue the same GraphQL query within one invocation.
+    LIST_CACHE_TTL = 60.0
+
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or get_api_key()
-        self.client = httpx.Client(timeout=30.0)
+        self.client = get_http_client()
         self._truncated: set[str] = set()
+        self._list_cache: dict[tuple[str, str | None], tuple[float, list[dict[str, Any]]]] = {}
+        self._uuid_cache: dict[str, str] = {}
+        self._viewer: dict[str, Any] | None = None
+
+    def __enter__(self) -> "LinearClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool.
+
+        The pool is process-wide and shared by every LinearClient; closing it
+        here tears down the connections eagerly (instead of at interpreter
+        exit), and any later request transparently opens a fresh pool.
+        """
+        close_http_client()
+
+    def _cached_list(
+        self, key: tuple[str, str | None], fetch: Callable[[], list[dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Return a cached list fetch, refreshing it once the TTL lapses."""
+        hit = self._list_cache.get(key)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < self.LIST_CACHE_TTL:
+            return hit[1]
+        if _disk_cache_enabled():
+            cached = _disk_cache_read(self._disk_key(key))
+            if cached is not None:
+                self._list_cache[key] = (now, cached)
+                return cached
+        result = fetch()
+        self._list_cache[key] = (now, result)
+        if _disk_cache_enabled():
+            _disk_cache_update({self._disk_key(key): {"at": time.time(), "data": result}})
+        return result
+
+    def _disk_key(self, key: tuple[str, str | None]) -> str:
+        """Disk-cache key, scoped per API key so workspaces never mix."""
+        scope = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:12]
+        return f"{scope}:{key[0]}:{key[1] or ''}"
+
+    def _invalidate_list(self, kind: str) -> None:
+        """Drop cached lists of one kind after a mutation changes them."""
+        for key in [k for k in self._list_cache if k[0] == kind]:
+            del self._list_cache[key]
+        if _disk_cache_enabled():
+            scope = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:12]
+            _disk_cache_update({}, remove_prefix=f"{scope}:{kind}:")
 
     def _mark_truncation(self, name: str, connection: dict[str, Any]) -> None:
         """Track whether a connection's results were truncated."""
@@ -1328,25 +1581,60 @@ class LinearClient:
         """Check if a named connection's last fetch was truncated."""
         return name in self._truncated
 
-    def _request(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make a GraphQL request to Linear."""
+    MAX_RETRIES = 4
+
+    def _request(
+        self,
+        query: str,
+        variables: dict[str, Any] | None = None,
+        *,
+        retry: bool | None = None,
+    ) -> dict[str, Any]:
+        """Make a GraphQL request to Linear.
+
+        Transient failures (429 and 5xx) are retried with exponential backoff,
+        honoring a Retry-After header when the API sends one. Queries retry by
+        default; mutations only retry when the caller opts in via retry=True.
+        """
         headers = {
             "Content-Type": "application/json",
             "Authorization": self.api_key,
         }
 
-        payload: dict[str, Any] = {"query": query}
-        if variables:
-            payload["variables"] = variables
+        body = _STATIC_QUERY_BODIES.get(query) if not variables else None
+        if retry is None:
+            retry = not query.lstrip().startswith("mutation")
 
-        try:
-            response = self.client.post(LINEAR_API_URL, headers=headers, json=payload)
-        except httpx.NetworkError as e:
-            raise LinearError(
-                code=ErrorCode.NETWORK_ERROR,
-                message=f"Network error: {e}",
-                suggestions=["Check your internet connection"],
-            )
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                if body is not None:
+                    response = self.client.post(LINEAR_API_URL, headers=headers, content=body)
+                else:
+                    payload: dict[str, Any] = {"query": query}
+                    if variables:
+                        payload["variables"] = variables
+                    if orjson is not None:
+                        response = self.client.post(
+                            LINEAR_API_URL, headers=headers, content=orjson.dumps(payload)
+                        )
+                    else:
+                        response = self.client.post(LINEAR_API_URL, headers=headers, json=payload)
+            except httpx.NetworkError as e:
+                raise LinearError(
+                    code=ErrorCode.NETWORK_ERROR,
+                    message=f"Network error: {e}",
+                    suggestions=["Check your internet connection"],
+                )
+
+            transient = response.status_code == 429 or response.status_code >= 500
+            if transient and retry and attempt < self.MAX_RETRIES - 1:
+                try:
+                    delay = float(response.headers.get("Retry-After", ""))
+                except ValueError:
+                    delay = min(2**attempt, 30) + random.random() * 0.5
+                time.sleep(delay)
+                continue
+            break
 
         if response.status_code == 429:
             raise LinearError(
@@ -1356,7 +1644,10 @@ class LinearClient:
             )
 
         try:
-            data = response.json()
+            if orjson is not None:
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
         except ValueError:
             if response.status_code != 200:
                 raise LinearError(
@@ -1414,7 +1705,10 @@ class LinearClient:
         return issue
 
     def get_workflow_states(self, team_id: str | None = None) -> list[dict[str, Any]]:
-        """Get workflow states, optionally filtered by team."""
+        """Get workflow states, optionally filtered by team (cached per client)."""
+        return self._cached_list(("states", team_id), lambda: self._fetch_workflow_states(team_id))
+
+    def _fetch_workflow_states(self, team_id: str | None = None) -> list[dict[str, Any]]:
         if team_id:
             data = self._request(QUERY_TEAM_STATES, {"teamId": team_id})
             team = data.get("team", {})
@@ -1431,7 +1725,10 @@ class LinearClient:
         return result
 
     def get_projects(self, team_id: str | None = None) -> list[dict[str, Any]]:
-        """Get projects, optionally filtered by team."""
+        """Get projects, optionally filtered by team (cached per client)."""
+        return self._cached_list(("projects", team_id), lambda: self._fetch_projects(team_id))
+
+    def _fetch_projects(self, team_id: str | None = None) -> list[dict[str, Any]]:
         if team_id:
             data = self._request(QUERY_TEAM_PROJECTS, {"teamId": team_id})
             team = data.get("team", {})
@@ -1459,18 +1756,19 @@ class LinearClient:
         """Find a project by name, optionally within a specific team."""
         projects = self.get_projects(team_id)
         project_name_lower = project_name.lower()
+        lowered = [(project["name"].lower(), project) for project in projects]
 
         # Exact match first
-        for project in projects:
-            if project["name"].lower() == project_name_lower:
+        for name, project in lowered:
+            if name == project_name_lower:
                 return project
 
         # Partial match
-        for project in projects:
-            if project_name_lower in project["name"].lower():
+        for name, project in lowered:
+            if project_name_lower in name:
                 return project
 
-        available = ", ".join(sorted(set(p["name"] for p in projects)))
+        available = _join_names(p["name"] for p in projects)
         suggestions = [f"Available projects: {available}"]
         if self.is_truncated("projects"):
             suggestions.append("Note: project list was truncated — more projects may exist")
@@ -1491,10 +1789,14 @@ class LinearClient:
         """Resolve a team by key (case-insensitive), exact id, or partial name."""
         teams = self.get_teams()
         ref_lower = ref.lower()
+        lowered = [
+            (team.get("key", "").lower(), team.get("name", "").lower(), team)
+            for team in teams
+        ]
 
         # Exact key match (case-insensitive)
-        for team in teams:
-            if team.get("key", "").lower() == ref_lower:
+        for key, _name, team in lowered:
+            if key == ref_lower:
                 return team
 
         # Exact id match
@@ -1503,11 +1805,11 @@ class LinearClient:
                 return team
 
         # Partial name match
-        for team in teams:
-            if ref_lower in team.get("name", "").lower():
+        for _key, name, team in lowered:
+            if ref_lower in name:
                 return team
 
-        available = ", ".join(sorted(t.get("key", "") for t in teams if t.get("key")))
+        available = _join_names(t.get("key", "") for t in teams if t.get("key"))
         suggestions = [f"Available team keys: {available}"] if available else []
         if self.is_truncated("teams"):
             suggestions.append("Note: team list was truncated — more teams may exist")
@@ -1528,18 +1830,19 @@ class LinearClient:
         """Find a milestone by name within a project."""
         milestones = self.get_milestones(project_id)
         milestone_name_lower = milestone_name.lower()
+        lowered = [(milestone["name"].lower(), milestone) for milestone in milestones]
 
         # Exact match first
-        for milestone in milestones:
-            if milestone["name"].lower() == milestone_name_lower:
+        for name, milestone in lowered:
+            if name == milestone_name_lower:
                 return milestone
 
         # Partial match
-        for milestone in milestones:
-            if milestone_name_lower in milestone["name"].lower():
+        for name, milestone in lowered:
+            if milestone_name_lower in name:
                 return milestone
 
-        available = ", ".join(sorted(set(m["name"] for m in milestones)))
+        available = _join_names(m["name"] for m in milestones)
         suggestions = [f"Available milestones: {available}"] if available else ["No milestones exist for this project"]
         if self.is_truncated("milestones"):
             suggestions.append("Note: milestone list was truncated — more milestones may exist")
@@ -1755,18 +2058,19 @@ class LinearClient:
         """Find a custom view by name (exact match first, then partial)."""
         views = self.get_custom_views()
         view_name_lower = view_name.lower()
+        lowered = [(view["name"].lower(), view) for view in views]
 
         # Exact match first
-        for view in views:
-            if view["name"].lower() == view_name_lower:
+        for name, view in lowered:
+            if name == view_name_lower:
                 return view
 
         # Partial match
-        for view in views:
-            if view_name_lower in view["name"].lower():
+        for name, view in lowered:
+            if view_name_lower in name:
                 return view
 
-        available = ", ".join(sorted(set(v["name"] for v in views)))
+        available = _join_names(v["name"] for v in views)
         raise LinearError(
             code=ErrorCode.VIEW_NOT_FOUND,
             message=f"View '{view_name}' not found",
@@ -1824,7 +2128,10 @@ class LinearClient:
         return True
 
     def get_labels(self, team_id: str | None = None) -> list[dict[str, Any]]:
-        """Get labels, optionally filtered by team."""
+        """Get labels, optionally filtered by team (cached per client)."""
+        return self._cached_list(("labels", team_id), lambda: self._fetch_labels(team_id))
+
+    def _fetch_labels(self, team_id: str | None = None) -> list[dict[str, Any]]:
         if team_id:
             data = self._request(QUERY_TEAM_LABELS, {"teamId": team_id})
             team = data.get("team", {})
@@ -1843,18 +2150,19 @@ class LinearClient:
         """Find a label by name, optionally within a specific team."""
         labels = self.get_labels(team_id)
         label_name_lower = label_name.lower()
+        lowered = [(label["name"].lower(), label) for label in labels]
 
         # Exact match first
-        for label in labels:
-            if label["name"].lower() == label_name_lower:
+        for name, label in lowered:
+            if name == label_name_lower:
                 return label
 
         # Partial match
-        for label in labels:
-            if label_name_lower in label["name"].lower():
+        for name, label in lowered:
+            if label_name_lower in name:
                 return label
 
-        available = ", ".join(sorted(set(l["name"] for l in labels)))
+        available = _join_names(l["name"] for l in labels)
         suggestions = [f"Available labels: {available}"]
         if self.is_truncated("labels"):
             suggestions.append("Note: label list was truncated — more labels may exist")
@@ -1865,8 +2173,28 @@ class LinearClient:
         )
 
     def resolve_label_names(self, label_names: list[str], team_id: str | None = None) -> list[str]:
-        """Resolve a list of label names to label IDs."""
-        return [self.find_label_by_name(name, team_id)["id"] for name in label_names]
+        """Resolve a list of label names to label IDs.
+
+        Fetches the label list once and resolves exact (case-insensitive)
+        matches via a dict lookup; only names without an exact match fall back
+        to find_label_by_name's partial-match scan (which also raises the
+        standard LABEL_NOT_FOUND on a miss).
+        """
+        if not label_names:
+            return []
+
+        labels = self.get_labels(team_id)
+        by_name: dict[str, dict[str, Any]] = {}
+        for label in labels:
+            by_name.setdefault(label["name"].lower(), label)
+
+        ids = []
+        for name in label_names:
+            label = by_name.get(name.lower())
+            if label is None:
+                label = self.find_label_by_name(name, team_id)
+            ids.append(label["id"])
+        return ids
 
     def create_label(
         self,
@@ -1902,6 +2230,7 @@ class LinearClient:
                 message="Failed to create label",
             )
 
+        self._invalidate_list("labels")
         return result.get("issueLabel", {})
 
     def delete_label(self, label_id: str) -> bool:
@@ -1922,6 +2251,7 @@ class LinearClient:
                 message="Failed to delete label",
             )
 
+        self._invalidate_list("labels")
         return True
 
     def update_label(
@@ -1964,6 +2294,7 @@ class LinearClient:
                 message="Failed to update label",
             )
 
+        self._invalidate_list("labels")
         return result.get("issueLabel", {})
 
     def create_project(
@@ -2016,6 +2347,7 @@ class LinearClient:
                 message="Failed to create project",
             )
 
+        self._invalidate_list("projects")
         return result.get("project", {})
 
     def delete_project(self, project_id: str) -> bool:
@@ -2036,6 +2368,7 @@ class LinearClient:
                 message="Failed to delete project",
             )
 
+        self._invalidate_list("projects")
         return True
 
     def update_project(
@@ -2094,15 +2427,29 @@ class LinearClient:
                 message="Failed to update project",
             )
 
+        self._invalidate_list("projects")
         return result.get("project", {})
 
     def get_viewer(self) -> dict[str, Any]:
-        """Get current authenticated user."""
-        data = self._request(QUERY_VIEWER)
-        return data.get("viewer", {})
+        """Get current authenticated user (cached per client and, opt-in, on disk)."""
+        if self._viewer is None:
+            key = self._disk_key(("viewer", None))
+            if _disk_cache_enabled():
+                cached = _disk_cache_read(key)
+                if isinstance(cached, dict):
+                    self._viewer = cached
+                    return cached
+            data = self._request(QUERY_VIEWER)
+            self._viewer = data.get("viewer", {})
+            if _disk_cache_enabled():
+                _disk_cache_update({key: {"at": time.time(), "data": self._viewer}})
+        return self._viewer
 
     def get_users(self) -> list[dict[str, Any]]:
-        """Get all users in workspace."""
+        """Get all users in workspace (cached per client)."""
+        return self._cached_list(("users", None), self._fetch_users)
+
+    def _fetch_users(self) -> list[dict[str, Any]]:
         data = self._request(QUERY_USERS)
         conn = data.get("users", {})
         self._mark_truncation("users", conn)
@@ -2126,14 +2473,12 @@ class LinearClient:
             viewer = self.get_viewer()
             return viewer or None
 
-        identifier_lower = identifier.lower()
-        for user in self.get_users():
-            if not user.get("active", False):
-                continue
-            if user.get("email", "").lower() == identifier_lower:
-                return user
-
-        return None
+        by_email = {
+            user.get("email", "").lower(): user
+            for user in self.get_users()
+            if user.get("active", False)
+        }
+        return by_email.get(identifier.lower())
 
     def list_issues(
         self,
@@ -2246,6 +2591,46 @@ class LinearClient:
             no_project: If True, don't assign to any project (ignores config default)
             assignee_id: User ID to assign the issue to
         """
+        input_data = self._build_issue_input(
+            config=config,
+            title=title,
+            description=description,
+            priority=priority,
+            estimate=estimate,
+            parent_id=parent_id,
+            state_id=state_id,
+            label_ids=label_ids,
+            project_id=project_id,
+            no_project=no_project,
+            assignee_id=assignee_id,
+        )
+
+        data = self._request(MUTATION_CREATE_ISSUE, {"input": input_data})
+        result = data.get("issueCreate", {})
+
+        if not result.get("success"):
+            raise LinearError(
+                code=ErrorCode.API_ERROR,
+                message="Failed to create issue",
+            )
+
+        return result.get("issue", {})
+
+    def _build_issue_input(
+        self,
+        config: LinearConfig,
+        title: str,
+        description: str | None = None,
+        priority: int | None = None,
+        estimate: int | None = None,
+        parent_id: str | None = None,
+        state_id: str | None = None,
+        label_ids: list[str] | None = None,
+        project_id: str | None = None,
+        no_project: bool = False,
+        assignee_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Build an IssueCreateInput dict (shared by single and batch create)."""
         input_data: dict[str, Any] = {
             "teamId": config.team_id,
             "title": title,
@@ -2276,16 +2661,7 @@ class LinearClient:
         if assignee_id:
             input_data["assigneeId"] = assignee_id
 
-        data = self._request(MUTATION_CREATE_ISSUE, {"input": input_data})
-        result = data.get("issueCreate", {})
-
-        if not result.get("success"):
-            raise LinearError(
-                code=ErrorCode.API_ERROR,
-                message="Failed to create issue",
-            )
-
-        return result.get("issue", {})
+        return input_data
 
     def update_issue(
         self,
@@ -2353,36 +2729,26 @@ class LinearClient:
         """Find a workflow state by name within a team."""
         states = self.get_workflow_states(team_id)
         state_name_lower = state_name.lower()
+        lowered = [(state["name"].lower(), state) for state in states]
 
         # Exact match first
-        for state in states:
-            if state["name"].lower() == state_name_lower:
+        for name, state in lowered:
+            if name == state_name_lower:
                 return state
 
         # Partial match
-        for state in states:
-            if state_name_lower in state["name"].lower():
+        for name, state in lowered:
+            if state_name_lower in name:
                 return state
 
         # Type-based match (e.g., "done" matches completed type)
-        type_mapping = {
-            "done": "completed",
-            "complete": "completed",
-            "finished": "completed",
-            "todo": "unstarted",
-            "backlog": "backlog",
-            "in progress": "started",
-            "started": "started",
-            "cancelled": "canceled",
-            "canceled": "canceled",
-        }
-        if state_name_lower in type_mapping:
-            target_type = type_mapping[state_name_lower]
+        target_type = _STATE_TYPE_MAPPING.get(state_name_lower)
+        if target_type is not None:
             for state in states:
                 if state.get("type") == target_type:
                     return state
 
-        available = ", ".join(sorted(set(s["name"] for s in states)))
+        available = _join_names(s["name"] for s in states)
         suggestions = [f"Available states: {available}"]
         if self.is_truncated("states"):
             suggestions.append("Note: state list was truncated — more states may exist")
@@ -2392,27 +2758,36 @@ class LinearClient:
             suggestions=suggestions,
         )
 
-    def mark_done(self, issue_id: str) -> dict[str, Any]:
-        """Mark an issue as completed."""
-        # First get the issue to find its team
-        issue = self.get_issue(issue_id)
-        team_id = issue.get("team", {}).get("id")
+    def _resolve_issue_uuid(self, issue_id: str) -> str:
+        """Resolve an identifier like ABC-123 to the issue's UUID.
 
-        if not team_id:
+        UUID-shaped inputs pass through untouched; resolved identifiers are
+        memoized per client, so posting N comments/attachments on one issue
+        costs a single lookup.
+        """
+        if _UUID_RE.match(issue_id):
+            return issue_id
+
+        cached = self._uuid_cache.get(issue_id)
+        if cached is not None:
+            return cached
+
+        data = self._request(QUERY_ISSUE_ID, {"id": issue_id})
+        issue_uuid = (data.get("issue") or {}).get("id")
+        if not issue_uuid:
             raise LinearError(
-                code=ErrorCode.API_ERROR,
-                message="Could not determine team for issue",
+                code=ErrorCode.ISSUE_NOT_FOUND,
+                message=f"Issue {issue_id} not found",
+                suggestions=["Check the issue identifier"],
             )
 
-        # Find the completed state
-        done_state = self.find_state_by_name(team_id, "done")
-        return self.update_issue(issue_id, state_id=done_state["id"])
+        self._uuid_cache[issue_id] = issue_uuid
+        return issue_uuid
 
-    def change_state(self, issue_id: str, state_name: str) -> dict[str, Any]:
-        """Change an issue's state by name."""
-        # First get the issue to find its team
-        issue = self.get_issue(issue_id)
-        team_id = issue.get("team", {}).get("id")
+    def _get_issue_team_id(self, issue_id: str) -> str:
+        """Resolve an issue to its team id via the slim QUERY_ISSUE_TEAM."""
+        data = self._request(QUERY_ISSUE_TEAM, {"id": issue_id})
+        team_id = (data.get("issue") or {}).get("team", {}).get("id")
 
         if not team_id:
             raise LinearError(
@@ -2420,7 +2795,17 @@ class LinearClient:
                 message="Could not determine team for issue",
             )
 
-        # Find the target state
+        return team_id
+
+    def mark_done(self, issue_id: str) -> dict[str, Any]:
+        """Mark an issue as completed."""
+        return self.change_state(issue_id, "done")
+
+    def change_state(self, issue_id: str, state_name: str) -> dict[str, Any]:
+        """Change an issue's state by name."""
+        # Only the team id is needed to scope the state lookup, so avoid
+        # fetching the full issue.
+        team_id = self._get_issue_team_id(issue_id)
         target_state = self.find_state_by_name(team_id, state_name)
         return self.update_issue(issue_id, state_id=target_state["id"])
 
@@ -2465,9 +2850,8 @@ class LinearClient:
             if parent_labels:
                 label_ids = [l["id"] for l in parent_labels]
 
-        created = []
-        for issue_data in issues:
-            issue = self.create_issue(
+        inputs = [
+            self._build_issue_input(
                 config=config,
                 title=issue_data.get("title", ""),
                 description=issue_data.get("description"),
@@ -2478,10 +2862,31 @@ class LinearClient:
                 no_project=no_project,
                 label_ids=label_ids,
             )
-            created.append(issue)
+            for issue_data in issues
+        ]
+
+        # Batch creation: one POST per chunk instead of one per sub-issue.
+        created = []
+        for start in range(0, len(inputs), self.CREATE_BATCH_SIZE):
+            created.extend(self._create_issue_batch(inputs[start : start + self.CREATE_BATCH_SIZE]))
 
         return created
 
+    # Sub-issue creations per issueBatchCreate request; kept modest so a single
+    # request stays well within API complexity limits.
+    CREATE_BATCH_SIZE = 10
+
+    def _create_issue_batch(self, inputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create several issues in one request via issueBatchCreate."""
+        if len(inputs) == 1:
+            data = self._request(MUTATION_CREATE_ISSUE, {"input": inputs[0]})
+            result = self._mutation_payload(data, "issueCreate", "create issue")
+            return [result.get("issue", {})]
+
+        data = self._request(MUTATION_BATCH_CREATE_ISSUES, {"input": {"issues": inputs}})
+        result = self._mutation_payload(data, "issueBatchCreate", "create issues")
+        return result.get("issues", [])
+
     def create_relation(
         self,
         issue_id: str,
@@ -2498,18 +2903,9 @@ class LinearClient:
         Returns:
             Created relation dict
         """
-        # Resolve identifiers to UUIDs
-        source = self.get_issue(issue_id)
-        target = self.get_issue(related_issue_id)
-
-        source_uuid = source.get("id")
-        target_uuid = target.get("id")
-
-        if not source_uuid or not target_uuid:
-            raise LinearError(
-                code=ErrorCode.API_ERROR,
-                message="Could not resolve issue UUIDs",
-            )
+        # Resolve identifiers to UUIDs; UUID-shaped inputs skip the lookup
+        source_uuid = self._resolve_issue_uuid(issue_id)
+        target_uuid = self._resolve_issue_uuid(related_issue_id)
 
         input_data = {
             "issueId": source_uuid,
@@ -2528,6 +2924,25 @@ class LinearClient:
 
         return result.get("issueRelation", {})
 
+    def _mutation_payload(self, data: dict[str, Any], key: str, action: str) -> dict[str, Any]:
+        """Extract a mutation's payload, raising API_ERROR unless it succeeded.
+
+        Single-lookup form of the repeated ``data.get(key, {}).get("success")``
+        chains: the happy path does two dict indexes and allocates nothing.
+        """
+        try:
+            result = data[key]
+            success = result["success"]
+        except KeyError:
+            success = False
+            result = {}
+        if not success:
+            raise LinearError(
+                code=ErrorCode.API_ERROR,
+                message=f"Failed to {action}",
+            )
+        return result
+
     def find_relation(self, issue_id: str, target_id: str) -> dict[str, Any] | None:
         """Find a relation between two issues.
 
@@ -2549,21 +2964,17 @@ class LinearClient:
                 suggestions=["Check the issue identifier is correct"],
             )
 
-        target_upper = target_id.upper()
-
-        # Check forward relations
-        for rel in issue.get("relations", {}).get("nodes", []):
-            related = rel.get("relatedIssue", {})
-            if related.get("identifier", "").upper() == target_upper:
-                return rel
+        # Index both directions by upper-cased identifier for O(1) lookup;
+        # forward relations are inserted last so they win on a (rare) tie.
+        by_identifier: dict[str, dict[str, Any]] = {}
+        for rel in reversed(issue.get("inverseRelations", {}).get("nodes", [])):
+            identifier = rel.get("issue", {}).get("identifier", "")
+            by_identifier[identifier.upper()] = rel
+        for rel in reversed(issue.get("relations", {}).get("nodes", [])):
+            identifier = rel.get("relatedIssue", {}).get("identifier", "")
+            by_identifier[identifier.upper()] = rel
 
-        # Check inverse relations
-        for rel in issue.get("inverseRelations", {}).get("nodes", []):
-            source = rel.get("issue", {})
-            if source.get("identifier", "").upper() == target_upper:
-                return rel
-
-        return None
+        return by_identifier.get(target_id.upper())
 
     def delete_relation(self, relation_id: str) -> bool:
         """Delete a relation by its ID.
@@ -2575,14 +2986,7 @@ class LinearClient:
             True if successful
         """
         data = self._request(MUTATION_DELETE_RELATION, {"id": relation_id})
-        result = data.get("issueRelationDelete", {})
-
-        if not result.get("success"):
-            raise LinearError(
-                code=ErrorCode.API_ERROR,
-                message="Failed to delete relation",
-            )
-
+        self._mutation_payload(data, "issueRelationDelete", "delete relation")
         return True
 
     def upload_file(self, file_path: str) -> str:
@@ -2595,20 +2999,31 @@ class LinearClient:
             Asset URL of the uploaded file
         """
         path = Path(file_path)
-        if not path.exists():
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
             raise LinearError(
                 code=ErrorCode.FILE_NOT_FOUND,
                 message=f"File not found: {file_path}",
                 suggestions=["Check the file path is correct"],
             )
-
-        content = path.read_bytes()
-        size = len(content)
         filename = path.name
 
-        content_type, _ = mimetypes.guess_type(filename)
-        if not content_type:
-            content_type = "application/octet-stream"
+        # With the disk cache enabled, identical bytes uploaded recently (e.g.
+        # a re-run script attaching the same screenshot) reuse the asset URL
+        # instead of re-uploading; assets are immutable so the URL stays valid.
+        digest = None
+        if _disk_cache_enabled():
+            hasher = hashlib.sha256()
+            with path.open("rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            cached = _disk_cache_read(self._disk_key(("upload", digest)))
+            if isinstance(cached, str):
+                return cached
+
+        content_type = _guess_content_type(path.suffix.lower())
 
         # Request pre-signed upload URL
         data = self._request(
@@ -2627,31 +3042,62 @@ class LinearClient:
         asset_url = upload_file.get("assetUrl")
 
         # Build headers from response
-        headers: dict[str, str] = {}
-        for header in upload_file.get("headers", []):
-            headers[header["key"]] = header["value"]
+        headers = {h["key"]: h["value"] for h in upload_file.get("headers", ())}
         headers["Content-Type"] = content_type
-        headers["Cache-Control"] = "public, max-age=31536000"
+        headers["Cache-Control"] = _UPLOAD_CACHE_CONTROL
+
+        # PUT file content to upload URL, streaming from disk so large files
+        # never sit fully in memory. Stream the response too: only the status
+        # matters, so the body (S3-style endpoints send XML) is never read.
+        # Transient failures retry with backoff against the same signed URL
+        # rather than restarting the whole flow.
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                with path.open("rb") as f:
+                    with self.client.stream(
+                        "PUT", upload_url, content=f, headers=headers
+                    ) as response:
+                        status_code = response.status_code
+                        retry_after = response.headers.get("Retry-After", "")
+            except (httpx.NetworkError, httpx.TimeoutException) as e:
+                if attempt < self.MAX_RETRIES - 1:
+                    time.sleep(min(2**attempt + random.random(), 30))
+                    continue
+                raise LinearError(
+                    code=ErrorCode.UPLOAD_FAILED,
+                    message=f"Upload failed: {e}",
+                    suggestions=["Check your internet connection and retry"],
+                )
 
-        # PUT file content to upload URL
-        try:
-            response = self.client.put(upload_url, content=content, headers=headers)
-        except httpx.NetworkError as e:
-            raise LinearError(
-                code=ErrorCode.UPLOAD_FAILED,
-                message=f"Upload failed: {e}",
-                suggestions=["Check your internet connection and retry"],
-            )
+            if status_code in (200, 201):
+                if digest is not None:
+                    _disk_cache_update(
+                        {
+                            self._disk_key(("upload", digest)): {
+                                "at": time.time(),
+                                "data": asset_url,
+                            }
+                        }
+                    )
+                return asset_url
+
+            # Retry timeouts, rate limits, and server errors; other 4xx
+            # (expired/invalid signed URL) fail fast.
+            transient = status_code in (408, 429) or status_code >= 500
+            if transient and attempt < self.MAX_RETRIES - 1:
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    delay = min(2**attempt + random.random(), 30)
+                time.sleep(delay)
+                continue
 
-        if response.status_code not in (200, 201):
             raise LinearError(
                 code=ErrorCode.UPLOAD_FAILED,
-                message=f"Upload failed: HTTP {response.status_code}",
+                message=f"Upload failed: HTTP {status_code}",
                 suggestions=["Retry the upload"],
             )
 
-        return asset_url
-
     def create_attachment(
         self,
         issue_id: str,
@@ -2670,13 +3116,7 @@ class LinearClient:
         Returns:
             Attachment dict with id, title, url
         """
-        issue = self.get_issue(issue_id)
-        issue_uuid = issue.get("id")
-        if not issue_uuid:
-            raise LinearError(
-                code=ErrorCode.API_ERROR,
-                message="Could not resolve issue UUID",
-            )
+        issue_uuid = self._resolve_issue_uuid(issue_id)
 
         input_data: dict[str, Any] = {
             "issueId": issue_uuid,
@@ -2687,14 +3127,7 @@ class LinearClient:
             input_data["subtitle"] = subtitle
 
         data = self._request(MUTATION_CREATE_ATTACHMENT, {"input": input_data})
-        result = data.get("attachmentCreate", {})
-
-        if not result.get("success"):
-            raise LinearError(
-                code=ErrorCode.API_ERROR,
-                message="Failed to create attachment",
-            )
-
+        result = self._mutation_payload(data, "attachmentCreate", "create attachment")
         return result.get("attachment", {})
 
     def create_document(
@@ -2722,27 +3155,20 @@ class LinearClient:
             Document dict with id, title, url, slugId
         """
         input_data: dict[str, Any] = {
-            "issueId": issue_id,
-            "title": title,
+            key: value
+            for key, value in (
+                ("issueId", issue_id),
+                ("title", title),
+                ("content", content),
+                ("projectId", project_id),
+                ("icon", icon),
+                ("color", color),
+            )
+            if value is not None
         }
-        if content is not None:
-            input_data["content"] = content
-        if project_id:
-            input_data["projectId"] = project_id
-        if icon:
-            input_data["icon"] = icon
-        if color:
-            input_data["color"] = color
 
         data = self._request(MUTATION_CREATE_DOCUMENT, {"input": input_data})
-        result = data.get("documentCreate", {})
-
-        if not result.get("success"):
-            raise LinearError(
-                code=ErrorCode.API_ERROR,
-                message="Failed to create document",
-            )
-
+        result = self._mutation_payload(data, "documentCreate", "create document")
         return result.get("document", {})
 
     def create_comment(self, issue_id: str, body: str) -> dict[str, Any]:
@@ -2755,26 +3181,12 @@ class LinearClient:
         Returns:
             Comment dict with id, body, url
         """
-        issue = self.get_issue(issue_id)
-        actual_id = issue.get("id")
-        if not actual_id:
-            raise LinearError(
-                code=ErrorCode.ISSUE_NOT_FOUND,
-                message=f"Issue {issue_id} not found",
-                suggestions=["Check the issue identifier"],
-            )
+        actual_id = self._resolve_issue_uuid(issue_id)
 
         data = self._request(
             MUTATION_CREATE_COMMENT, {"input": {"issueId": actual_id, "body": body}}
         )
-        result = data.get("commentCreate", {})
-
-        if not result.get("success"):
-            raise LinearError(
-                code=ErrorCode.API_ERROR,
-                message="Failed to create comment",
-            )
-
+        result = self._mutation_payload(data, "commentCreate", "create comment")
         return result.get("comment", {})
 
     def delete_comment(self, comment_id: str) -> bool:
@@ -2810,8 +3222,6 @@ app = typer.Typer(
     add_completion=False,
 )
 
-_verbose = False
-
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
@@ -2939,33 +3349,44 @@ def create(
                 suggestions=["Remove --team/LINEAR_TEAM or choose the parent issue's team"],
             )
 
-        # Resolve project name to ID if provided; otherwise inherit the parent's
-        # project before falling back to any config default.
+        # Project: explicit name wins; otherwise inherit the parent's project
+        # before falling back to any config default.
         project_id = None
-        if project:
-            project_info = client.find_project_by_name(project, config.team_id)
-            project_id = project_info["id"]
-        elif parent_issue and not no_project:
+        if not project and parent_issue and not no_project:
             parent_project = parent_issue.get("project")
             if parent_project:
                 project_id = parent_project.get("id")
 
-        # Resolve label names to IDs; otherwise inherit parent labels before
+        # Labels: explicit names win; otherwise inherit parent labels before
         # falling back to configured default labels.
         label_ids = None
-        if label:
-            label_ids = client.resolve_label_names(label, config.team_id)
-        elif parent_issue:
+        label_names = label
+        if not label_names and parent_issue:
             parent_labels = parent_issue.get("labels", {}).get("nodes", [])
             if parent_labels:
                 label_ids = [l["id"] for l in parent_labels]
-        if label_ids is None and not label and config.default_labels:
-            label_ids = client.resolve_label_names(config.default_labels, config.team_id)
+        if not label_names and label_ids is None and config.default_labels:
+            label_names = config.default_labels
+
+        # The project/label/assignee lookups are independent network calls, so
+        # run whichever are needed concurrently.
+        tasks: dict[str, Callable[[], Any]] = {}
+        if project:
+            tasks["project"] = lambda: client.find_project_by_name(project, config.team_id)
+        if label_names:
+            tasks["labels"] = lambda: client.resolve_label_names(label_names, config.team_id)
+        if assignee:
+            tasks["assignee"] = lambda: client.find_user(assignee)
+        resolved = _run_resolutions(tasks)
+
+        if project:
+            project_id = resolved["project"]["id"]
+        if label_names:
+            label_ids = resolved["labels"]
 
-        # Resolve assignee name/email to ID
         assignee_id = None
         if assignee:
-            user = client.find_user(assignee)
+            user = resolved["assignee"]
             if not user:
                 raise LinearError(
                     code=ErrorCode.INVALID_INPUT,
@@ -3010,15 +3431,7 @@ def create(
             except LinearError as e:
                 cycle_warning = f"Issue created but cycle assignment failed: {e.message}"
 
-        result_data: dict[str, Any] = {
-            "identifier": issue.get("identifier"),
-            "title": issue.get("title"),
-            "url": issue.get("url"),
-            "state": issue.get("state", {}).get("name"),
-        }
-        label_nodes = issue.get("labels", {}).get("nodes", [])
-        if label_nodes:
-            result_data["labels"] = [l["name"] for l in label_nodes]
+        result_data = _compact_issue(issue)
         if cycle_info:
             result_data["cycle"] = cycle_info
         if cycle_warning:
@@ -3029,11 +3442,11 @@ def create(
             result=result_data,
             metadata=metadata,
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -3200,16 +3613,14 @@ def update(
         if no_labels or label:
             # Fetch current issue to get existing labels
             current = get_current_issue()
-            current_labels = current.get("labels", {}).get("nodes", [])
-            current_label_ids = [l["id"] for l in current_labels]
+            current_ids = {l["id"] for l in current.get("labels", {}).get("nodes", [])}
 
-            if no_labels and not label:
-                removed_label_ids = current_label_ids
             if label:
                 label_ids = client.resolve_label_names(label, resolve_team_id())
                 # Remove labels not in the new set
-                new_set = set(label_ids)
-                removed_label_ids = [lid for lid in current_label_ids if lid not in new_set]
+                removed_label_ids = list(current_ids - set(label_ids))
+            else:
+                removed_label_ids = list(current_ids)
 
         # Resolve assignee
         assignee_id = None
@@ -3276,15 +3687,7 @@ def update(
             cycle_id=cycle_id,
         )
 
-        result_data: dict[str, Any] = {
-            "identifier": issue.get("identifier"),
-            "title": issue.get("title"),
-            "url": issue.get("url"),
-            "state": issue.get("state", {}).get("name"),
-        }
-        label_nodes = issue.get("labels", {}).get("nodes", [])
-        if label_nodes:
-            result_data["labels"] = [l["name"] for l in label_nodes]
+        result_data = _compact_issue(issue)
         project_node = issue.get("project")
         if project_node:
             result_data["project"] = project_node.get("name")
@@ -3299,11 +3702,11 @@ def update(
             command=command,
             result=result_data,
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -3324,18 +3727,13 @@ def done(
 
         response = format_success(
             command=command,
-            result={
-                "identifier": issue.get("identifier"),
-                "title": issue.get("title"),
-                "url": issue.get("url"),
-                "state": issue.get("state", {}).get("name"),
-            },
+            result=_compact_issue(issue),
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -3359,18 +3757,13 @@ def state(
 
         response = format_success(
             command=command,
-            result={
-                "identifier": issue.get("identifier"),
-                "title": issue.get("title"),
-                "url": issue.get("url"),
-                "state": issue.get("state", {}).get("name"),
-            },
+            result=_compact_issue(issue),
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -3424,8 +3817,8 @@ def break_issue(
 
         # Parse JSON issues
         try:
-            issues_data = json.loads(issues)
-        except json.JSONDecodeError as e:
+            issues_data = parse_json_arg(issues)
+        except ValueError as e:
             raise LinearError(
                 code=ErrorCode.INVALID_INPUT,
                 message=f"Invalid JSON for --issues: {e}",
@@ -3489,11 +3882,11 @@ def break_issue(
                 "teamId": team_id,
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -3533,7 +3926,8 @@ def relate(
         client = LinearClient()
 
         relation_lower = relation.lower()
-        if relation_lower not in RELATION_TYPES:
+        api_type = RELATION_TYPES.get(relation_lower)
+        if api_type is None:
             available = ", ".join(RELATION_TYPES.keys())
             raise LinearError(
                 code=ErrorCode.INVALID_INPUT,
@@ -3541,8 +3935,6 @@ def relate(
                 suggestions=[f"Available types: {available}"],
             )
 
-        api_type = RELATION_TYPES[relation_lower]
-
         # For "blocked-by", flip source and target
         if relation_lower == "blocked-by":
             source, target = target_id, issue_id
@@ -3561,11 +3953,11 @@ def relate(
                 "apiType": result.get("type"),
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -3605,11 +3997,11 @@ def unrelate(
                 "relationType": relation.get("type"),
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -3638,8 +4030,6 @@ def get(
         linear.py get ABC-123 --comments
     """
     command = "get"
-    global _verbose
-    _verbose = verbose
 
     try:
         client = LinearClient()
@@ -3658,7 +4048,7 @@ def get(
             for c in children
         ]
 
-        if _verbose:
+        if verbose:
             # Full output — all fields
             result: dict[str, Any] = {
                 "identifier": issue.get("identifier"),
@@ -3746,28 +4136,24 @@ def get(
             result["children"] = children_data
 
         # Add relations (verbose only)
-        if _verbose:
+        if verbose:
             relations_data = []
-            for rel in issue.get("relations", {}).get("nodes", []):
-                related = rel.get("relatedIssue", {})
-                relations_data.append({
-                    "type": rel.get("type"),
-                    "issue": related.get("identifier"),
-                    "title": related.get("title"),
-                })
-            for rel in issue.get("inverseRelations", {}).get("nodes", []):
-                rel_type = rel.get("type")
-                # Invert the direction for display
-                if rel_type == "blocks":
-                    rel_type = "blocked-by"
-                elif rel_type == "blocked-by":
-                    rel_type = "blocks"
-                related = rel.get("issue", {})
-                relations_data.append({
-                    "type": rel_type,
-                    "issue": related.get("identifier"),
-                    "title": related.get("title"),
-                })
+            # Inverse relations report the opposite direction for display
+            inverted = {"blocks": "blocked-by", "blocked-by": "blocks"}
+            for issue_key, invert, nodes in (
+                ("relatedIssue", False, issue.get("relations", {}).get("nodes", [])),
+                ("issue", True, issue.get("inverseRelations", {}).get("nodes", [])),
+            ):
+                for rel in nodes:
+                    rel_type = rel.get("type")
+                    if invert:
+                        rel_type = inverted.get(rel_type, rel_type)
+                    related = rel.get(issue_key, {})
+                    relations_data.append({
+                        "type": rel_type,
+                        "issue": related.get("identifier"),
+                        "title": related.get("title"),
+                    })
             if relations_data:
                 result["relations"] = relations_data
 
@@ -3776,8 +4162,9 @@ def get(
             commits = []
             for att in attachments:
                 url = att.get("url", "")
-                if "/commit/" in url:
-                    sha = url.rsplit("/commit/", 1)[-1]
+                # rpartition scans the URL once, unlike `in` + rsplit
+                _, sep, sha = url.rpartition("/commit/")
+                if sep:
                     commits.append(sha)
                 elif url.startswith("commit://"):
                     commits.append(url.removeprefix("commit://"))
@@ -3821,11 +4208,11 @@ def get(
             result["truncated"] = truncated
 
         response = format_success(command=command, result=result)
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -3858,14 +4245,16 @@ def states(
         for state in states_list:
             team = state.get("team", {})
             team_key = team.get("key", "unknown")
-            if team_key not in teams:
-                teams[team_key] = {
+            entry = teams.setdefault(
+                team_key,
+                {
                     "id": team.get("id"),
                     "key": team_key,
                     "name": team.get("name"),
                     "states": [],
-                }
-            teams[team_key]["states"].append(
+                },
+            )
+            entry["states"].append(
                 {
                     "id": state.get("id"),
                     "name": state.get("name"),
@@ -3887,11 +4276,11 @@ def states(
             result=result_data,
             metadata={"totalStates": len(states_list)},
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -3924,14 +4313,16 @@ def projects(
         for project in projects_list:
             team = project.get("team", {})
             team_key = team.get("key", "unknown")
-            if team_key not in teams:
-                teams[team_key] = {
+            entry = teams.setdefault(
+                team_key,
+                {
                     "id": team.get("id"),
                     "key": team_key,
                     "name": team.get("name"),
                     "projects": [],
-                }
-            teams[team_key]["projects"].append(
+                },
+            )
+            entry["projects"].append(
                 {
                     "id": project.get("id"),
                     "name": project.get("name"),
@@ -3952,11 +4343,11 @@ def projects(
             result=result_data,
             metadata={"totalProjects": len(projects_list)},
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4034,11 +4425,11 @@ def create_project(
             },
             metadata={"teamId": config.team_id},
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4070,11 +4461,11 @@ def delete_project(
                 "deleted": True,
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4160,11 +4551,11 @@ def update_project(
                 "teams": teams,
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4228,11 +4619,11 @@ def milestones(
             result=result_data,
             metadata={"count": len(formatted)},
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4291,11 +4682,11 @@ def create_milestone_cmd(
             result_data["project"] = proj.get("name")
 
         response = format_success(command=command, result=result_data)
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4332,11 +4723,11 @@ def delete_milestone_cmd(
                 "deleted": True,
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4417,11 +4808,11 @@ def cycles(
             result=result_data,
             metadata={"count": len(formatted)},
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4522,11 +4913,11 @@ def cycle(
             command=command,
             result=result_data,
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4583,11 +4974,11 @@ def create_cycle_cmd(
             result=result_data,
             metadata={"id": cycle_data.get("id")},
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4646,11 +5037,11 @@ def update_cycle_cmd(
             command=command,
             result=result_data,
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4660,22 +5051,34 @@ def labels(
         None,
         "--team",
         "-t",
-        help="Filter by team ID (optional)",
+        help="Filter by team ID (defaults to the configured team)",
+    ),
+    all_teams: bool = typer.Option(
+        False,
+        "--all",
+        help="List labels across all teams, ignoring the configured team",
     ),
 ) -> None:
     """List labels.
 
-    Without --team, returns all labels across all teams.
-    With --team, returns labels for that specific team.
+    Scopes to the configured team when one is set; --team overrides it and
+    --all lists every team's labels across the workspace.
 
     Examples:
         linear.py labels
+        linear.py labels --all
         linear.py labels --team abc123-team-uuid
     """
     command = "labels"
 
     try:
         client = LinearClient()
+        if team_id is None and not all_teams:
+            # A team-scoped query transfers one team's labels instead of the
+            # whole workspace; fall through to workspace-wide when unconfigured.
+            config = _load_config_optional()
+            if config is not None and config.team_id:
+                team_id = config.team_id
         labels_list = client.get_labels(team_id)
 
         # Group by team for cleaner output
@@ -4683,14 +5086,16 @@ def labels(
         for label in labels_list:
             team = label.get("team") or {}
             team_key = team.get("key", "workspace")
-            if team_key not in teams:
-                teams[team_key] = {
+            entry = teams.setdefault(
+                team_key,
+                {
                     "id": team.get("id"),
                     "key": team_key,
                     "name": team.get("name"),
                     "labels": [],
-                }
-            teams[team_key]["labels"].append(
+                },
+            )
+            entry["labels"].append(
                 {
                     "id": label.get("id"),
                     "name": label.get("name"),
@@ -4712,11 +5117,11 @@ def labels(
             result=result_data,
             metadata={"totalLabels": len(labels_list)},
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4770,11 +5175,11 @@ def create_label_cmd(
             },
             metadata={"teamId": config.team_id},
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4806,11 +5211,11 @@ def delete_label_cmd(
                 "deleted": True,
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4870,11 +5275,11 @@ def update_label(
                 "team": {"id": team.get("id"), "key": team.get("key"), "name": team.get("name")} if team else None,
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -4912,11 +5317,11 @@ def members() -> None:
             result=result_data,
             metadata={"count": len(active_users)},
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -5015,8 +5420,6 @@ def list_cmd(
         linear.py list --milestone "v1.0"       # Issues in milestone v1.0
     """
     command = "list"
-    global _verbose
-    _verbose = verbose
 
     try:
         client = LinearClient()
@@ -5036,18 +5439,84 @@ def list_cmd(
                 # needs team context.
                 pass
 
-        # Handle --mine flag
+        # Handle priority filter
+        priority_val = None
+        if priority is not None:
+            priority_val = parse_priority(priority)
+
+        # Handle estimate filter
+        estimate_val = None
+        no_estimate = False
+        if estimate is not None:
+            if estimate.lower() == "none":
+                no_estimate = True
+            else:
+                try:
+                    estimate_val = int(estimate)
+                except ValueError:
+                    raise LinearError(
+                        code=ErrorCode.INVALID_INPUT,
+                        message=f"Invalid estimate '{estimate}'",
+                        suggestions=["Use a number or 'none' for unestimated issues"],
+                    )
+
+        # Handle state filter: type aliases resolve locally, names need the API
+        state_type = None
+        state_needs_lookup = False
+        if state:
+            state_lower = state.lower().replace(" ", "_")
+            if state_lower in STATE_TYPE_ALIASES:
+                state_type = STATE_TYPE_ALIASES[state_lower]
+            else:
+                state_needs_lookup = True
+
+        # Named states and cycles are team-scoped, so resolve the team up front
+        if (state_needs_lookup or cycle) and not team_id:
+            team_id = resolve_config(client, team).team_id
+
+        # Remaining filters are independent API lookups; resolve them together
+        def _lookup_state() -> dict[str, Any]:
+            try:
+                return client.find_state_by_name(team_id, state)
+            except LinearError:
+                raise LinearError(
+                    code=ErrorCode.STATE_NOT_FOUND,
+                    message=f"State '{state}' not found",
+                    suggestions=[
+                        "Use state name (e.g., 'In Progress') or type shortcut",
+                        "Type shortcuts: backlog, todo, started, done, canceled",
+                    ],
+                )
+
+        tasks: dict[str, Callable[[], Any]] = {}
+        if mine:
+            tasks["viewer"] = client.get_viewer
+        elif assignee:
+            tasks["assignee"] = lambda: client.find_user(assignee)
+        if creator:
+            tasks["creator"] = lambda: client.find_user(creator)
+        if project:
+            tasks["project"] = lambda: client.find_project_by_name(project, team_id)
+        if state_needs_lookup:
+            tasks["state"] = _lookup_state
+        if label:
+            tasks["labels"] = lambda: client.resolve_label_names(label, team_id)
+        if cycle:
+            tasks["cycle"] = lambda: client.resolve_cycle(cycle, team_id)
+
+        resolved = _run_resolutions(tasks)
+
+        # Handle --mine / assignee filter
         assignee_id = None
         if mine:
-            viewer = client.get_viewer()
-            assignee_id = viewer.get("id")
+            assignee_id = resolved["viewer"].get("id")
             if not assignee_id:
                 raise LinearError(
                     code=ErrorCode.API_ERROR,
                     message="Could not determine current user",
                 )
         elif assignee:
-            user = client.find_user(assignee)
+            user = resolved["assignee"]
             if not user:
                 raise LinearError(
                     code=ErrorCode.INVALID_INPUT,
@@ -5063,7 +5532,7 @@ def list_cmd(
         # Handle creator filter
         creator_id = None
         if creator:
-            user = client.find_user(creator)
+            user = resolved["creator"]
             if not user:
                 raise LinearError(
                     code=ErrorCode.INVALID_INPUT,
@@ -5076,70 +5545,10 @@ def list_cmd(
                 )
             creator_id = user.get("id")
 
-        # Handle priority filter
-        priority_val = None
-        if priority is not None:
-            priority_val = parse_priority(priority)
-
-        # Handle estimate filter
-        estimate_val = None
-        no_estimate = False
-        if estimate is not None:
-            if estimate.lower() == "none":
-                no_estimate = True
-            else:
-                try:
-                    estimate_val = int(estimate)
-                except ValueError:
-                    raise LinearError(
-                        code=ErrorCode.INVALID_INPUT,
-                        message=f"Invalid estimate '{estimate}'",
-                        suggestions=["Use a number or 'none' for unestimated issues"],
-                    )
-
-        # Handle project filter
-        project_id = None
-        if project:
-            project_info = client.find_project_by_name(project, team_id)
-            project_id = project_info.get("id")
-
-        # Handle state filter
-        state_id = None
-        state_type = None
-        if state:
-            state_lower = state.lower().replace(" ", "_")
-            # Check if it's a type alias
-            if state_lower in STATE_TYPE_ALIASES:
-                state_type = STATE_TYPE_ALIASES[state_lower]
-            else:
-                if not team_id:
-                    team_id = resolve_config(client, team).team_id
-                # Try to find by name
-                try:
-                    state_info = client.find_state_by_name(team_id, state)
-                    state_id = state_info.get("id")
-                except LinearError:
-                    raise LinearError(
-                        code=ErrorCode.STATE_NOT_FOUND,
-                        message=f"State '{state}' not found",
-                        suggestions=[
-                            "Use state name (e.g., 'In Progress') or type shortcut",
-                            "Type shortcuts: backlog, todo, started, done, canceled",
-                        ],
-                    )
-
-        # Handle label filter
-        label_ids = None
-        if label:
-            label_ids = client.resolve_label_names(label, team_id)
-
-        # Handle cycle filter
-        cycle_id = None
-        if cycle:
-            if not team_id:
-                team_id = resolve_config(client, team).team_id
-            resolved_cycle = client.resolve_cycle(cycle, team_id)
-            cycle_id = resolved_cycle["id"]
+        project_id = resolved["project"].get("id") if project else None
+        state_id = resolved["state"].get("id") if state_needs_lookup else None
+        label_ids = resolved["labels"] if label else None
+        cycle_id = resolved["cycle"]["id"] if cycle else None
 
         # Fetch issues
         issues = client.list_issues(
@@ -5159,14 +5568,14 @@ def list_cmd(
         )
 
         # Format output
-        priority_labels = {0: "None", 1: "Urgent", 2: "High", 3: "Normal", 4: "Low"}
         formatted_issues = []
         for issue in issues:
+            p = issue.get("priority", 0)
             formatted = {
                 "identifier": issue.get("identifier"),
                 "title": issue.get("title"),
                 "state": issue.get("state", {}).get("name"),
-                "priority": priority_labels.get(issue.get("priority", 0), "Unknown"),
+                "priority": PRIORITY_LABELS[p] if isinstance(p, int) and 0 <= p <= 4 else "Unknown",
                 "estimate": issue.get("estimate"),
             }
             assignee_data = issue.get("assignee")
@@ -5212,12 +5621,13 @@ def list_cmd(
             command=command,
             result={"issues": formatted_issues},
             metadata=metadata,
+            verbose=verbose,
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -5273,11 +5683,11 @@ def attach(
                 "assetUrl": asset_url,
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -5322,12 +5732,23 @@ def document(
         doc_content = content
         if file:
             file_path = Path(file)
-            if not file_path.exists():
+            try:
+                file_size = file_path.stat().st_size
+            except FileNotFoundError:
                 raise LinearError(
                     code=ErrorCode.FILE_NOT_FOUND,
                     message=f"File not found: {file}",
                     suggestions=["Check the file path is correct"],
                 )
+            if file_size > MAX_DOCUMENT_BYTES:
+                raise LinearError(
+                    code=ErrorCode.FILE_TOO_LARGE,
+                    message=(
+                        f"File is {file_size} bytes; documents are limited to "
+                        f"{MAX_DOCUMENT_BYTES} bytes"
+                    ),
+                    suggestions=["Split the document or attach it as a file instead"],
+                )
             doc_content = file_path.read_text(encoding="utf-8")
 
         # Resolve project name to ID if provided
@@ -5365,11 +5786,11 @@ def document(
             result["project"] = project_ref.get("name")
 
         response = format_success(command=command, result=result)
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -5391,20 +5812,21 @@ def attach_commit(
     """
     command = "attach-commit"
 
+    # Only this command shells out to git, so the import stays local to it and
+    # every other invocation skips loading subprocess at startup.
+    import subprocess
+
     try:
         # Get git commit info
         ref = commit or "HEAD"
         try:
-            commit_hash = subprocess.check_output(
-                ["git", "rev-parse", ref], text=True
-            ).strip()
-            commit_msg = subprocess.check_output(
-                ["git", "log", "-1", "--format=%s", commit_hash], text=True
+            # One git process for hash, subject, and author; %x1f separates the
+            # fields so subjects containing newlines or colons parse cleanly.
+            commit_info = subprocess.check_output(
+                ["git", "log", "-1", "--format=%H%x1f%s%x1f%an", ref], text=True
             ).strip()
-            commit_author = subprocess.check_output(
-                ["git", "log", "-1", "--format=%an", commit_hash], text=True
-            ).strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            commit_hash, commit_msg, commit_author = commit_info.split("\x1f", 2)
+        except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
             raise LinearError(
                 code=ErrorCode.INVALID_INPUT,
                 message="Could not read git commit info",
@@ -5419,15 +5841,11 @@ def attach_commit(
             ).strip()
             # SSH: git@github.com:org/repo.git -> https://github.com/org/repo
             # HTTPS: https://github.com/org/repo.git -> https://github.com/org/repo
-            if remote_url.startswith("git@"):
-                # git@github.com:org/repo.git
-                host_path = remote_url.split("@", 1)[1]
-                host, path = host_path.split(":", 1)
-                path = path.removesuffix(".git")
+            match = _REMOTE_URL_RE.match(remote_url)
+            if match:
+                host = match["http_host"] or match["ssh_host"]
+                path = match["http_path"] or match["ssh_path"]
                 commit_url = f"https://{host}/{path}/commit/{commit_hash}"
-            elif remote_url.startswith("https://") or remote_url.startswith("http://"):
-                base = remote_url.removesuffix(".git")
-                commit_url = f"{base}/commit/{commit_hash}"
         except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
             # No remote or parse error — use local fallback URL
             pass
@@ -5454,11 +5872,11 @@ def attach_commit(
                 "attachmentId": attachment.get("id"),
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -5488,11 +5906,11 @@ def comment(
                 "url": result.get("url"),
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -5520,11 +5938,11 @@ def delete_comment_cmd(
                 "deleted": True,
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -5551,8 +5969,6 @@ def views(
         linear.py views --team abc123-team-uuid
     """
     command = "views"
-    global _verbose
-    _verbose = verbose
 
     try:
         client = LinearClient()
@@ -5584,7 +6000,7 @@ def views(
                     "name": team.get("name"),
                 }
 
-            if _verbose:
+            if verbose:
                 view_data["filterData"] = view.get("filterData")
                 view_data["color"] = view.get("color")
                 view_data["icon"] = view.get("icon")
@@ -5601,12 +6017,13 @@ def views(
             command=command,
             result={"views": formatted_views},
             metadata={"totalViews": len(formatted_views)},
+            verbose=verbose,
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -5661,8 +6078,8 @@ def create_view_cmd(
         filter_data = None
         if filter_json:
             try:
-                filter_data = json.loads(filter_json)
-            except json.JSONDecodeError as e:
+                filter_data = parse_json_arg(filter_json)
+            except ValueError as e:
                 raise LinearError(
                     code=ErrorCode.INVALID_INPUT,
                     message=f"Invalid filter JSON: {e}",
@@ -5705,11 +6122,11 @@ def create_view_cmd(
             command=command,
             result=result,
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
@@ -5747,11 +6164,11 @@ def delete_view_cmd(
                 "deleted": True,
             },
         )
-        typer.echo(output_json(response))
+        write_json(response)
 
     except LinearError as e:
         error_response = format_error(command, e)
-        typer.echo(output_json(error_response))
+        write_json(error_response)
         raise typer.Exit(code=1)
 
 
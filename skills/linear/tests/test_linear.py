@@ -44,6 +44,22 @@ def parent_issue(team=None):
 def route(query, variables, *, teams, calls):
     """Shared canned-response router keyed by the GraphQL query text."""
     calls.append((query, variables))
+    if "issueBatchCreate" in query:
+        return {
+            "issueBatchCreate": {
+                "success": True,
+                "issues": [
+                    {
+                        "id": f"sub-uuid-{i}",
+                        "identifier": f"ABC-{124 + i}",
+                        "title": issue_input.get("title", ""),
+                        "url": f"https://linear.app/x/issue/ABC-{124 + i}",
+                        "state": {"name": "Todo"},
+                    }
+                    for i, issue_input in enumerate(variables["input"]["issues"])
+                ],
+            }
+        }
     if "issueCreate" in query:
         title = (variables or {}).get("input", {}).get("title", "")
         return {
@@ -418,7 +434,10 @@ def test_break_derives_team_from_parent_without_config(monkeypatch):
 
     # No teams query was needed; the parent issue supplied the team.
     assert all("teams {" not in q for q, _ in calls)
-    # Every sub-issue was created in the parent's team.
-    create_calls = [v for q, v in calls if "issueCreate" in q]
-    assert len(create_calls) == 2
-    assert all(v["input"]["teamId"] == "team-eng-uuid" for v in create_calls)
+    # Both sub-issues went out in a single issueBatchCreate request, each
+    # created in the parent's team.
+    create_calls = [v for q, v in calls if "issueBatchCreate" in q]
+    assert len(create_calls) == 1
+    issue_inputs = create_calls[0]["input"]["issues"]
+    assert len(issue_inputs) == 2
+    assert all(i["teamId"] == "team-eng-uuid" for i in issue_inputs)